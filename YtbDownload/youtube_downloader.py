@@ -2,7 +2,14 @@
 import yt_dlp
 
 def download_video(url, output_path='.'):
+    # Fetch only the audio stream and let yt-dlp hand it straight to ffmpeg, so only the MP3 is written
     ydl_opts = {
+        'format': 'bestaudio/best',
+        'postprocessors': [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': 'mp3',
+            'preferredquality': '192',
+        }],
         'outtmpl': f'{output_path}/%(title)s.%(ext)s',
         'noplaylist': True,
     }
@@ -17,15 +17,24 @@ import io
 import sys
 import re
 import threading
+import queue
 import time
+import random
 import socket
 import hashlib
+import mmap
 import unicodedata
+import concurrent.futures
+import functools
 import platform
 import traceback
 from pathlib import Path
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 
+import requests
+import requests.adapters
+import httplib2
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 
@@ -33,7 +42,8 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import Request, AuthorizedSession
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
 
 # --- Configuration ---
@@ -42,18 +52,44 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 CLIENT_SECRETS_PATH_ENV = os.environ.get('CLIENT_SECRETS')
 TOKEN_PATH = os.path.join(project_root, 'token.json')
 
+# Bytes per download request (override with GDRIVE_CHUNK). Each in-flight download
+# buffers up to one chunk, so memory use is roughly MAX_WORKERS * CHUNK_SIZE.
+CHUNK_SIZE = int(os.environ.get('GDRIVE_CHUNK', 64 * 1024 * 1024))   # 64 MiB per chunk
+SOCKET_TIMEOUT = 120                # seconds; large chunks can exceed the 60s default
+STREAM_READ_SIZE = 1024 * 1024      # bytes read per iteration while streaming a range
+DRIVE_MEDIA_URL = 'https://www.googleapis.com/drive/v3/files/{file_id}?alt=media'
+SEGMENTED_MIN_SIZE = 64 * 1024 * 1024   # larger files are fetched over several connections
+DOWNLOAD_SEGMENTS = 4
+SESSION_POOL_SIZE = 32              # >= MAX_WORKERS * DOWNLOAD_SEGMENTS keep-alive connections
+SOCKET_RCVBUF = 4 * 1024 * 1024     # SO_RCVBUF for download sockets
+
 # Retry/backoff tunables
-CHUNK_SIZE = 8 * 1024 * 1024        # 8 MiB per chunk
 MAX_CHUNK_RETRIES = 5
 MAX_FILE_RETRIES = 5
 INITIAL_BACKOFF = 1.0
 BACKOFF_FACTOR = 2.0
 MAX_BACKOFF_SECONDS = 120.0
+TAIL_RETRY_DELAY = 0.05             # final chunk retries once a file is >90% done
+
+# Parallel downloads (files per folder tree handled concurrently)
+MAX_WORKERS = 6
+BATCH_GET_LIMIT = 100               # Drive accepts at most 100 calls per batch request
+
+# GUI logging: per-file progress is reported at most every PROGRESS_MIN_INTERVAL seconds;
+# log lines are queued and written in batches, keeping the last LOG_MAX_LINES
+PROGRESS_MIN_INTERVAL = 0.5
+LOG_DRAIN_MS = 100
+LOG_BATCH_LINES = 100
+LOG_MAX_LINES = 5000
 
 # Behavior toggles
 FORCE_REEXPORT_NATIVE = False
 FAILED_ITEMS_PATH = "failed_downloads.txt"
 
+_thread_local = threading.local()
+_session_lock = threading.Lock()
+_shared_session = None
+
 # --- Windows filename sanitization ---
 INVALID_WIN_CHARS = r'<>:"/\\|?*\x00-\x1f'
 INVALID_RE = re.compile(f'[{re.escape(INVALID_WIN_CHARS)}]')
@@ -92,16 +128,106 @@ def windows_longpath(path: Path) -> str:
     return p
 
 # --- Utilities ---
-def _safe_sleep_backoff(attempt, http_status=None):
+class _AdaptiveThrottle:
+    # Spaces out Drive requests only once the API has answered 429; the gap doubles on
+    # every 429 and halves on every success until it is gone again.
+    MIN_INTERVAL = 0.05
+    MAX_INTERVAL = 2.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._interval = 0.0
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            if not self._interval:
+                return
+            now = time.monotonic()
+            delay = max(0.0, self._next_slot - now)
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay:
+            time.sleep(delay)
+
+    def on_throttled(self):
+        with self._lock:
+            self._interval = min(max(self._interval * 2, self.MIN_INTERVAL), self.MAX_INTERVAL)
+
+    def on_success(self):
+        if not self._interval:
+            return
+        with self._lock:
+            self._interval /= 2
+            if self._interval < self.MIN_INTERVAL:
+                self._interval = 0.0
+
+_throttle = _AdaptiveThrottle()
+
+def _parse_retry_after(value):
+    # Retry-After is either delta-seconds or an HTTP date
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+def _safe_sleep_backoff(attempt, http_status=None, retry_after=None, near_done=False):
+    if http_status == 429:
+        _throttle.on_throttled()
+    delay = _parse_retry_after(retry_after)
+    if delay is not None:
+        time.sleep(min(delay, MAX_BACKOFF_SECONDS))
+        return
+    if near_done and http_status != 429 and attempt >= MAX_CHUNK_RETRIES - 1:
+        # last chunk retries of an almost finished file: retry right away
+        time.sleep(TAIL_RETRY_DELAY)
+        return
     base = INITIAL_BACKOFF * (BACKOFF_FACTOR ** (attempt - 1))
     if http_status is not None and (http_status == 429 or 500 <= http_status < 600):
         base *= 2.0
-    delay = min(base, MAX_BACKOFF_SECONDS)
+    # jitter keeps parallel workers that failed together from retrying in lockstep
+    delay = random.uniform(INITIAL_BACKOFF, min(MAX_BACKOFF_SECONDS, base * 3))
     time.sleep(delay)
 
-def md5_of_file(path: Path, chunk=8192):
-    h = hashlib.md5()
+def _advise_sequential(fd):
+    # Ask the kernel to read ahead for a single sequential pass (no-op on Windows)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except (AttributeError, OSError):
+        pass
+
+def _preallocate(fh, size):
+    # Reserve the final size in one extent where supported, else extend the file sparsely
+    try:
+        os.posix_fallocate(fh.fileno(), 0, size)
+    except (AttributeError, OSError):
+        fh.truncate(size)
+
+def _new_hash(algo):
+    # usedforsecurity=False picks OpenSSL's fast path without the FIPS wrapper (integrity only)
+    return hashlib.new(algo, usedforsecurity=False)
+
+def hash_of_file(path: Path, algo='md5', chunk=4 * 1024 * 1024):
     with open(windows_longpath(path), 'rb') as f:
+        _advise_sequential(f.fileno())
+        # Python 3.11+: the read/update loop runs in C
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: _new_hash(algo)).hexdigest()
+        h = _new_hash(algo)
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+                return h.hexdigest()
+        except (ValueError, OSError, OverflowError):
+            # empty files cannot be mapped; very large ones may not fit the address space
+            pass
         while True:
             data = f.read(chunk)
             if not data:
@@ -109,8 +235,13 @@ def md5_of_file(path: Path, chunk=8192):
             h.update(data)
     return h.hexdigest()
 
+def md5_of_file(path: Path):
+    # Drive only publishes md5Checksum, so Drive verification is always md5
+    return hash_of_file(path, 'md5')
+
 # --- Authentication (interactive by default) ---
-def get_credentials():
+@functools.lru_cache(maxsize=1)
+def _load_credentials():
     creds = None
     if not CLIENT_SECRETS_PATH_ENV or not os.path.exists(CLIENT_SECRETS_PATH_ENV):
         raise FileNotFoundError("CLIENT_SECRETS environment variable not set or path is invalid.")
@@ -126,37 +257,98 @@ def get_credentials():
             f.write(creds.to_json())
     return creds
 
+def get_credentials():
+    # Loaded once per process; later calls only refresh an expired token
+    creds = _load_credentials()
+    if creds.expired and creds.refresh_token:
+        creds.refresh(Request())
+        with open(TOKEN_PATH, 'w') as f:
+            f.write(creds.to_json())
+    return creds
+
+def build_drive_service(creds):
+    # static_discovery uses the discovery document bundled with googleapiclient (no HTTP fetch).
+    # The timeout is set on this client only: a process-wide socket default would also cut off
+    # the local OAuth redirect server while the user signs in.
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=SOCKET_TIMEOUT))
+    return build('drive', 'v3', http=http, static_discovery=True, cache_discovery=False)
+
+@functools.lru_cache(maxsize=1)
+def get_drive_service(creds):
+    # Service for the traversal/lister thread, reused across download runs with the same creds
+    return build_drive_service(creds)
+
 # --- Drive helpers ---
+_ID_PATTERNS = [
+    re.compile(r'^[a-zA-Z0-9_-]{10,}$'),
+    re.compile(r'/folders/([a-zA-Z0-9_-]+)'),
+    re.compile(r'/d/([a-zA-Z0-9_-]+)'),
+    re.compile(r'id=([a-zA-Z0-9_-]+)'),
+]
+
 def extract_file_id(drive_url_or_id: str) -> str:
     s = drive_url_or_id.strip()
-    if re.match(r'^[a-zA-Z0-9_-]{10,}$', s):
-        return s
-    m = re.search(r'/folders/([a-zA-Z0-9_-]+)', s)
-    if m:
-        return m.group(1)
-    m = re.search(r'/d/([a-zA-Z0-9_-]+)', s)
-    if m:
-        return m.group(1)
-    m = re.search(r'id=([a-zA-Z0-9_-]+)', s)
-    if m:
-        return m.group(1)
+    for pattern in _ID_PATTERNS:
+        m = pattern.search(s)
+        if m:
+            return m.group(1 if pattern.groups else 0)
     raise ValueError("Could not extract file or folder id from input")
 
-def list_folder_children(service, folder_id):
-    page_token = None
-    q = f"'{folder_id}' in parents and trashed = false"
-    fields = "nextPageToken, files(id, name, mimeType, size, md5Checksum)"
-    while True:
-        resp = service.files().list(q=q, spaces='drive', fields=fields, pageToken=page_token, pageSize=1000).execute()
-        for f in resp.get('files', []):
-            yield f
-        page_token = resp.get('nextPageToken')
-        if not page_token:
-            break
-
-def get_file_metadata(service, file_id):
+class FolderChildrenLister:
+    # Yields a folder's children while the next files.list page is already in flight.
+    # Every page is fetched on `executor`; give it a single worker so the (not thread-safe)
+    # service is only ever used from that one thread.
+    FIELDS = "nextPageToken, files(id, name, mimeType, size, md5Checksum)"
+
+    def __init__(self, service, folder_id, executor):
+        self.service = service
+        self.folder_id = folder_id
+        self.executor = executor
+
+    def _fetch_page(self, page_token):
+        q = f"'{self.folder_id}' in parents and trashed = false"
+        return self.service.files().list(q=q, spaces='drive', fields=self.FIELDS, pageToken=page_token,
+                                         pageSize=1000, orderBy='folder,name').execute()
+
+    def __iter__(self):
+        pending = self.executor.submit(self._fetch_page, None)
+        while pending is not None:
+            resp = pending.result()
+            page_token = resp.get('nextPageToken')
+            pending = self.executor.submit(self._fetch_page, page_token) if page_token else None
+            yield from resp.get('files', [])
+
+def list_folder_children(service, folder_id, executor=None):
+    if executor is not None:
+        yield from FolderChildrenLister(service, folder_id, executor)
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as own_executor:
+        yield from FolderChildrenLister(service, folder_id, own_executor)
+
+def get_files_metadata_batch(service, file_ids):
+    # files.get for many ids, up to BATCH_GET_LIMIT per HTTP round trip; ids whose
+    # lookup failed are left out of the result
     fields = 'id,name,mimeType,size,md5Checksum'
-    return service.files().get(fileId=file_id, fields=fields).execute()
+    results = {}
+
+    def on_response(request_id, response, exception):
+        if exception is None:
+            results[request_id] = response
+
+    file_ids = list(file_ids)
+    for i in range(0, len(file_ids), BATCH_GET_LIMIT):
+        batch = service.new_batch_http_request(callback=on_response)
+        for file_id in file_ids[i:i + BATCH_GET_LIMIT]:
+            batch.add(service.files().get(fileId=file_id, fields=fields), request_id=file_id)
+        batch.execute()
+    return results
+
+def _listing_incomplete(item):
+    # files.list rows normally carry everything needed; refresh the odd one that does not
+    mime = item.get('mimeType')
+    if not mime:
+        return True
+    return not mime.startswith('application/vnd.google-apps.') and item.get('size') is None
 
 # --- Skip logic ---
 def should_skip_binary_file(local_path: Path, drive_size, drive_md5, log_callback):
@@ -172,9 +364,12 @@ def should_skip_binary_file(local_path: Path, drive_size, drive_md5, log_callbac
             drive_size_int = int(drive_size)
         except Exception:
             drive_size_int = None
-    if drive_size_int is not None and local_size == drive_size_int:
-        log_callback(f"Skipping {local_path.name} (size matches: {local_size} bytes)")
-        return True
+    if drive_size_int is not None:
+        # a size match is trusted; a size mismatch cannot have a matching md5
+        if local_size == drive_size_int:
+            log_callback(f"Skipping {local_path.name} (size matches: {local_size} bytes)")
+            return True
+        return False
     if drive_md5:
         try:
             local_md5 = md5_of_file(local_path)
@@ -186,7 +381,180 @@ def should_skip_binary_file(local_path: Path, drive_size, drive_md5, log_callbac
     return False
 
 # --- Robust download functions (Windows-safe) ---
-def download_file_to_path_with_retries(service, file_meta, out_path: Path, log_callback, progress_percent_callback):
+class _ByteProgress:
+    # Thread-safe byte counter that reports whole-percent changes for one file,
+    # at most once per PROGRESS_MIN_INTERVAL (100% is always reported)
+    def __init__(self, total, safe_name, log_callback, progress_percent_callback, done=0):
+        self._lock = threading.Lock()
+        self._total = total
+        self._done = done
+        self._last_pct = -1
+        self._last_emit = 0.0
+        self._safe_name = safe_name
+        self._log_callback = log_callback
+        self._progress_percent_callback = progress_percent_callback
+
+    def add(self, nbytes):
+        with self._lock:
+            self._done += nbytes
+            pct = int(self._done * 100 / self._total) if self._total else 100
+            if pct == self._last_pct:
+                return
+            now = time.monotonic()
+            if pct < 100 and now - self._last_emit < PROGRESS_MIN_INTERVAL:
+                return
+            self._last_pct = pct
+            self._last_emit = now
+        self._log_callback(f"Downloading {self._safe_name}: {pct}%")
+        self._progress_percent_callback(pct)
+
+    def fraction(self):
+        return self._done / self._total if self._total else 1.0
+
+def _fetch_range(session, url, start, end, write, progress, safe_name, log_callback):
+    # GET bytes [start, end] and hand them to write(pos, data); a failed range is retried as-is
+    expected = end - start + 1
+    chunk_attempt = 0
+    while True:
+        written = 0
+        _throttle.wait()
+        try:
+            # iter_content wraps urllib3 read errors in requests exceptions, so the handlers below retry them
+            with session.get(url, headers={'Range': f'bytes={start}-{end}'}, stream=True, timeout=SOCKET_TIMEOUT) as resp:
+                resp.raise_for_status()
+                for data in resp.iter_content(STREAM_READ_SIZE):
+                    if written + len(data) > expected:
+                        raise IOError(f"Server returned more than the requested {expected} bytes")
+                    write(start + written, data)
+                    written += len(data)
+                    progress.add(len(data))
+            if written != expected:
+                raise IOError(f"Short read: got {written} of {expected} bytes")
+            _throttle.on_success()
+            return
+        except requests.HTTPError as exc:
+            progress.add(-written)
+            status_code = exc.response.status_code if exc.response is not None else None
+            retry_after = exc.response.headers.get('Retry-After') if exc.response is not None else None
+            chunk_attempt += 1
+            log_callback(f"HttpError chunk ({chunk_attempt}/{MAX_CHUNK_RETRIES}) for {safe_name}: status={status_code} error={exc}")
+            if chunk_attempt > MAX_CHUNK_RETRIES:
+                raise
+            _safe_sleep_backoff(chunk_attempt, http_status=status_code, retry_after=retry_after, near_done=progress.fraction() > 0.9)
+        except (requests.RequestException, socket.timeout, socket.error, OSError) as exc:
+            progress.add(-written)
+            chunk_attempt += 1
+            log_callback(f"Network error chunk ({chunk_attempt}/{MAX_CHUNK_RETRIES}) for {safe_name}: {exc}")
+            if chunk_attempt > MAX_CHUNK_RETRIES:
+                raise
+            _safe_sleep_backoff(chunk_attempt, near_done=progress.fraction() > 0.9)
+
+def _download_ranges(session, file_id, fh, total, safe_name, log_callback, progress_percent_callback):
+    # Single stream of CHUNK_SIZE Range requests over one keep-alive session, resuming
+    # from the current length of the .part file
+    url = DRIVE_MEDIA_URL.format(file_id=file_id)
+    offset = fh.seek(0, os.SEEK_END)
+    if offset > total:
+        fh.truncate(0)
+        offset = 0
+    progress = _ByteProgress(total, safe_name, log_callback, progress_percent_callback, done=offset)
+
+    def write(pos, data):
+        fh.seek(pos)
+        fh.write(data)
+
+    while offset < total:
+        end = min(offset + CHUNK_SIZE, total) - 1
+        _fetch_range(session, url, offset, end, write, progress, safe_name, log_callback)
+        offset = end + 1
+
+def _download_segments(session, file_id, fh, total, safe_name, log_callback, progress_percent_callback):
+    # Split the file into DOWNLOAD_SEGMENTS byte ranges fetched concurrently into a
+    # preallocated .part file
+    url = DRIVE_MEDIA_URL.format(file_id=file_id)
+    _preallocate(fh, total)
+    progress = _ByteProgress(total, safe_name, log_callback, progress_percent_callback)
+    write_lock = threading.Lock()
+    aborted = threading.Event()
+
+    def write(pos, data):
+        with write_lock:
+            fh.seek(pos)
+            fh.write(data)
+
+    def fetch_segment(start, end):
+        try:
+            while start <= end and not aborted.is_set():
+                chunk_end = min(start + CHUNK_SIZE, end + 1) - 1
+                _fetch_range(session, url, start, chunk_end, write, progress, safe_name, log_callback)
+                start = chunk_end + 1
+        except Exception:
+            aborted.set()
+            raise
+
+    segment_len = -(-total // DOWNLOAD_SEGMENTS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_SEGMENTS) as pool:
+        futures = [pool.submit(fetch_segment, start, min(start + segment_len, total) - 1)
+                   for start in range(0, total, segment_len)]
+    for future in futures:
+        future.result()
+
+def _verify_download(out_path: Path, drive_size, drive_md5, log_callback, pending_md5=None):
+    # The size check alone cannot catch a bad segment in a preallocated file, so md5 is
+    # always checked when Drive has one. Callers downloading many files pass pending_md5
+    # to hash them later in parallel.
+    if drive_size is not None:
+        try:
+            local_size = out_path.stat().st_size
+            if local_size != int(drive_size):
+                log_callback(f"Warning: size mismatch for {out_path.name} ({local_size} != {drive_size} bytes)")
+        except Exception:
+            pass
+    if not drive_md5:
+        return
+    if pending_md5 is not None:
+        pending_md5.append((out_path, drive_md5))
+        return
+    try:
+        if md5_of_file(out_path) != drive_md5:
+            log_callback(f"Warning: md5 mismatch for {out_path.name}")
+    except Exception:
+        pass
+
+def md5_many(paths, executor=None):
+    # Hash several independent files concurrently; returns {path: hexdigest or Exception}
+    paths = list(paths)
+    if not paths:
+        return {}
+    own_executor = executor is None
+    if own_executor:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1))
+    try:
+        futures = {executor.submit(md5_of_file, path): path for path in paths}
+        results = {}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
+        return results
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+def verify_md5_parallel(pending_md5, log_callback):
+    # md5 is CPU-bound, so hash all deferred files at once on a process pool
+    if not pending_md5:
+        return
+    log_callback(f"Verifying md5 for {len(pending_md5)} file(s)...")
+    expected = dict(pending_md5)
+    for path, result in md5_many(expected).items():
+        if isinstance(result, Exception):
+            log_callback(f"Could not compute md5 for {path.name}: {result}")
+        elif result != expected[path]:
+            log_callback(f"Warning: md5 mismatch for {path.name}")
+
+def download_file_to_path_with_retries(service, file_meta, out_path: Path, log_callback, progress_percent_callback, session=None, pending_md5=None):
     file_id = file_meta['id']
     raw_name = file_meta.get('name') or file_id
     safe_name = sanitize_name(raw_name)
@@ -203,52 +571,68 @@ def download_file_to_path_with_retries(service, file_meta, out_path: Path, log_c
 
     temp_path = out_path.with_suffix(out_path.suffix + ".part") if out_path.suffix else Path(str(out_path) + ".part")
     ensure_parent_dir(temp_path)
+    use_ranges = session is not None and drive_size is not None
+    use_segments = use_ranges and int(drive_size) > SEGMENTED_MIN_SIZE
 
     for file_attempt in range(1, MAX_FILE_RETRIES + 1):
         try:
-            mode = "r+b" if temp_path.exists() else "wb"
+            # segments land out of order, so a preallocated .part is never resumed
+            mode = "r+b" if temp_path.exists() and not use_segments else "wb"
             open_path = windows_longpath(temp_path)
             with open(open_path, mode) as fh:
                 if mode == "r+b":
                     fh.seek(0, os.SEEK_END)
-                request = service.files().get_media(fileId=file_id)
-                downloader = MediaIoBaseDownload(fh, request, chunksize=CHUNK_SIZE)
-                done = False
-                chunk_attempt = 0
-                last_pct = -1
-                while not done:
-                    try:
-                        status, done = downloader.next_chunk()
-                        chunk_attempt = 0
-                        if status:
-                            pct = int(status.progress() * 100)
-                            if pct != last_pct:
-                                last_pct = pct
-                                log_callback(f"Downloading {safe_name}: {pct}%")
-                                progress_percent_callback(pct)
-                    except HttpError as exc:
-                        status_code = None
+                if use_segments:
+                    _download_segments(session, file_id, fh, int(drive_size), safe_name, log_callback, progress_percent_callback)
+                elif use_ranges:
+                    _download_ranges(session, file_id, fh, int(drive_size), safe_name, log_callback, progress_percent_callback)
+                else:
+                    # size unknown: let MediaIoBaseDownload discover it
+                    request = service.files().get_media(fileId=file_id)
+                    downloader = MediaIoBaseDownload(fh, request, chunksize=CHUNK_SIZE)
+                    done = False
+                    chunk_attempt = 0
+                    last_pct = -1
+                    last_emit = 0.0
+                    while not done:
                         try:
-                            status_code = int(exc.resp.status)
-                        except Exception:
-                            pass
-                        chunk_attempt += 1
-                        log_callback(f"HttpError chunk ({chunk_attempt}/{MAX_CHUNK_RETRIES}) for {safe_name}: status={status_code} error={exc}")
-                        if chunk_attempt > MAX_CHUNK_RETRIES:
-                            raise
-                        _safe_sleep_backoff(chunk_attempt, http_status=status_code)
-                        request = service.files().get_media(fileId=file_id)
-                        downloader = MediaIoBaseDownload(fh, request, chunksize=CHUNK_SIZE)
-                        continue
-                    except (socket.timeout, socket.error, OSError) as exc:
-                        chunk_attempt += 1
-                        log_callback(f"Network error chunk ({chunk_attempt}/{MAX_CHUNK_RETRIES}) for {safe_name}: {exc}")
-                        if chunk_attempt > MAX_CHUNK_RETRIES:
-                            raise
-                        _safe_sleep_backoff(chunk_attempt)
-                        request = service.files().get_media(fileId=file_id)
-                        downloader = MediaIoBaseDownload(fh, request, chunksize=CHUNK_SIZE)
-                        continue
+                            _throttle.wait()
+                            status, done = downloader.next_chunk()
+                            chunk_attempt = 0
+                            _throttle.on_success()
+                            if status:
+                                pct = int(status.progress() * 100)
+                                if pct != last_pct:
+                                    last_pct = pct
+                                    now = time.monotonic()
+                                    if pct >= 100 or now - last_emit >= PROGRESS_MIN_INTERVAL:
+                                        last_emit = now
+                                        log_callback(f"Downloading {safe_name}: {pct}%")
+                                        progress_percent_callback(pct)
+                        except HttpError as exc:
+                            status_code = None
+                            try:
+                                status_code = int(exc.resp.status)
+                            except Exception:
+                                pass
+                            retry_after = exc.resp.get('retry-after') if exc.resp is not None else None
+                            chunk_attempt += 1
+                            log_callback(f"HttpError chunk ({chunk_attempt}/{MAX_CHUNK_RETRIES}) for {safe_name}: status={status_code} error={exc}")
+                            if chunk_attempt > MAX_CHUNK_RETRIES:
+                                raise
+                            _safe_sleep_backoff(chunk_attempt, http_status=status_code, retry_after=retry_after, near_done=last_pct > 90)
+                            request = service.files().get_media(fileId=file_id)
+                            downloader = MediaIoBaseDownload(fh, request, chunksize=CHUNK_SIZE)
+                            continue
+                        except (socket.timeout, socket.error, OSError) as exc:
+                            chunk_attempt += 1
+                            log_callback(f"Network error chunk ({chunk_attempt}/{MAX_CHUNK_RETRIES}) for {safe_name}: {exc}")
+                            if chunk_attempt > MAX_CHUNK_RETRIES:
+                                raise
+                            _safe_sleep_backoff(chunk_attempt, near_done=last_pct > 90)
+                            request = service.files().get_media(fileId=file_id)
+                            downloader = MediaIoBaseDownload(fh, request, chunksize=CHUNK_SIZE)
+                            continue
 
             # finalize: atomic replace using longpath when needed
             try:
@@ -257,13 +641,7 @@ def download_file_to_path_with_retries(service, file_meta, out_path: Path, log_c
                 temp_path.replace(out_path)
             log_callback(f"Saved: {out_path}")
             progress_percent_callback(100)
-            if drive_md5:
-                try:
-                    local_md5 = md5_of_file(out_path)
-                    if local_md5 != drive_md5:
-                        log_callback(f"Warning: md5 mismatch for {out_path.name}")
-                except Exception:
-                    pass
+            _verify_download(out_path, drive_size, drive_md5, log_callback, pending_md5)
             return str(out_path)
 
         except Exception as e:
@@ -298,27 +676,34 @@ def export_google_workspace_file_with_retries(service, file_meta, mime_type, out
                 done = False
                 chunk_attempt = 0
                 last_pct = -1
+                last_emit = 0.0
                 while not done:
                     try:
+                        _throttle.wait()
                         status, done = downloader.next_chunk()
                         chunk_attempt = 0
+                        _throttle.on_success()
                         if status:
                             pct = int(status.progress() * 100)
                             if pct != last_pct:
                                 last_pct = pct
-                                log_callback(f"Exporting {final_out.name}: {pct}%")
-                                progress_percent_callback(pct)
+                                now = time.monotonic()
+                                if pct >= 100 or now - last_emit >= PROGRESS_MIN_INTERVAL:
+                                    last_emit = now
+                                    log_callback(f"Exporting {final_out.name}: {pct}%")
+                                    progress_percent_callback(pct)
                     except HttpError as exc:
                         status_code = None
                         try:
                             status_code = int(exc.resp.status)
                         except Exception:
                             pass
+                        retry_after = exc.resp.get('retry-after') if exc.resp is not None else None
                         chunk_attempt += 1
                         log_callback(f"HttpError export chunk ({chunk_attempt}/{MAX_CHUNK_RETRIES}) for {final_out.name}: status={status_code} error={exc}")
                         if chunk_attempt > MAX_CHUNK_RETRIES:
                             raise
-                        _safe_sleep_backoff(chunk_attempt, http_status=status_code)
+                        _safe_sleep_backoff(chunk_attempt, http_status=status_code, retry_after=retry_after, near_done=last_pct > 90)
                         request = service.files().export_media(fileId=file_meta['id'], mimeType=mime_type)
                         downloader = MediaIoBaseDownload(fh, request, chunksize=CHUNK_SIZE)
                         continue
@@ -327,7 +712,7 @@ def export_google_workspace_file_with_retries(service, file_meta, mime_type, out
                         log_callback(f"Network error export chunk ({chunk_attempt}/{MAX_CHUNK_RETRIES}) for {final_out.name}: {exc}")
                         if chunk_attempt > MAX_CHUNK_RETRIES:
                             raise
-                        _safe_sleep_backoff(chunk_attempt)
+                        _safe_sleep_backoff(chunk_attempt, near_done=last_pct > 90)
                         request = service.files().export_media(fileId=file_meta['id'], mimeType=mime_type)
                         downloader = MediaIoBaseDownload(fh, request, chunksize=CHUNK_SIZE)
                         continue
@@ -347,46 +732,115 @@ def export_google_workspace_file_with_retries(service, file_meta, mime_type, out
             _safe_sleep_backoff(file_attempt)
 
 # --- Recursive download with failure logging ---
-def download_folder_recursive(service, folder_id, target_dir, log_callback, progress_percent_callback, failed_items):
+def get_thread_service(creds):
+    # httplib2 (used by googleapiclient) is not thread-safe: each pool worker keeps its own service
+    service = getattr(_thread_local, 'service', None)
+    if service is None or getattr(_thread_local, 'creds', None) is not creds:
+        service = build_drive_service(creds)
+        _thread_local.service = service
+        _thread_local.creds = creds
+    return service
+
+class _DriveHTTPAdapter(requests.adapters.HTTPAdapter):
+    # TCP_NODELAY so short requests are not held back by Nagle; a larger receive buffer
+    # so one stream can cover the bandwidth-delay product of fast links
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+def get_drive_session(creds):
+    # One AuthorizedSession shared by all workers and segments; its urllib3 pool keeps up
+    # to SESSION_POOL_SIZE connections alive for reuse across files
+    global _shared_session
+    with _session_lock:
+        if _shared_session is None or _shared_session.credentials is not creds:
+            session = AuthorizedSession(creds)
+            session.mount('https://', _DriveHTTPAdapter(pool_maxsize=SESSION_POOL_SIZE))
+            _shared_session = session
+        return _shared_session
+
+def download_folder_recursive(service, creds, folder_id, target_dir, log_callback, progress_percent_callback, failed_items):
     meta = service.files().get(fileId=folder_id, fields='id,name,mimeType').execute()
     folder_name = sanitize_name(meta.get('name') or folder_id)
     base_path = Path(target_dir) / folder_name
     log_callback(f"Starting folder: {folder_name}")
-    _download_folder_contents(service, folder_id, base_path, log_callback, progress_percent_callback, failed_items)
-
-def _download_folder_contents(service, folder_id, current_path: Path, log_callback, progress_percent_callback, failed_items):
+    futures = {}
+    pending_md5 = []
+    # `service` is handed to a single lister thread from here on; workers build their own
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=1) as lister:
+            _download_folder_contents(service, creds, folder_id, base_path, log_callback, progress_percent_callback, failed_items, executor, futures, pending_md5, lister)
+            concurrent.futures.wait(futures)
+    finally:
+        # Runs even if the root listing fails: files already submitted still get reported and verified
+        for future, item in futures.items():
+            exc = future.exception()
+            if exc is not None:
+                name = item.get('name') or item['id']
+                log_callback(f"ERROR downloading {name}: {exc}")
+                failed_items.append({'id': item['id'], 'name': name, 'error': str(exc)})
+        verify_md5_parallel(pending_md5, log_callback)
+
+def _download_folder_contents(service, creds, folder_id, current_path: Path, log_callback, progress_percent_callback, failed_items, executor, futures, pending_md5, lister):
+    # Traversal stays on the calling thread; files are handed to the worker pool as they are listed
     current_path.mkdir(parents=True, exist_ok=True)
-    for item in list_folder_children(service, folder_id):
+
+    def dispatch(item):
         item_id = item['id']
         name = item.get('name') or item_id
-        mime = item.get('mimeType', '')
+        if item.get('mimeType') == 'application/vnd.google-apps.folder':
+            log_callback(f"Entering folder: {sanitize_name(name)}")
+            try:
+                _download_folder_contents(service, creds, item_id, current_path / sanitize_name(name), log_callback, progress_percent_callback, failed_items, executor, futures, pending_md5, lister)
+            except Exception as e:
+                log_callback(f"ERROR listing folder {name}: {e}")
+                failed_items.append({'id': item_id, 'name': name, 'error': str(e)})
+            return
+        future = executor.submit(_download_item, creds, item, current_path, log_callback, progress_percent_callback, pending_md5)
+        futures[future] = item
+
+    incomplete = []
+    for item in list_folder_children(service, folder_id, lister):
+        if _listing_incomplete(item):
+            incomplete.append(item)
+        else:
+            dispatch(item)
+    if incomplete:
         try:
-            meta = get_file_metadata(service, item_id)
-            if meta.get('mimeType') == 'application/vnd.google-apps.folder':
-                log_callback(f"Entering folder: {sanitize_name(name)}")
-                _download_folder_contents(service, item_id, current_path / sanitize_name(name), log_callback, progress_percent_callback, failed_items)
-            else:
-                if meta.get('mimeType') == 'application/vnd.google-apps.document':
-                    out_file = current_path / f"{sanitize_name(name)}.pdf"
-                    log_callback(f"Exporting Google Doc: {name}")
-                    export_google_workspace_file_with_retries(service, meta, 'application/pdf', out_file, log_callback, progress_percent_callback)
-                elif meta.get('mimeType') == 'application/vnd.google-apps.spreadsheet':
-                    out_file = current_path / f"{sanitize_name(name)}.xlsx"
-                    log_callback(f"Exporting Google Sheet: {name}")
-                    export_google_workspace_file_with_retries(service, meta, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', out_file, log_callback, progress_percent_callback)
-                elif meta.get('mimeType') == 'application/vnd.google-apps.presentation':
-                    out_file = current_path / f"{sanitize_name(name)}.pdf"
-                    log_callback(f"Exporting Google Slide: {name}")
-                    export_google_workspace_file_with_retries(service, meta, 'application/pdf', out_file, log_callback, progress_percent_callback)
-                else:
-                    out_file = current_path / sanitize_name(name)
-                    log_callback(f"Downloading file: {name}")
-                    download_file_to_path_with_retries(service, meta, out_file, log_callback, progress_percent_callback)
-                time.sleep(0.2)
+            # runs on the lister thread, which owns `service`
+            refreshed = lister.submit(get_files_metadata_batch, service, [it['id'] for it in incomplete]).result()
         except Exception as e:
-            log_callback(f"ERROR downloading {name}: {e}")
-            failed_items.append({'id': item_id, 'name': name, 'error': str(e)})
-            continue
+            log_callback(f"Could not refresh metadata for {len(incomplete)} item(s): {e}")
+            refreshed = {}
+        for item in incomplete:
+            dispatch(refreshed.get(item['id'], item))
+
+def _download_item(creds, item, current_path: Path, log_callback, progress_percent_callback, pending_md5):
+    service = get_thread_service(creds)
+    name = item.get('name') or item['id']
+    # the files.list row already carries id, name, mimeType, size and md5Checksum
+    meta = item
+    if meta.get('mimeType') == 'application/vnd.google-apps.document':
+        out_file = current_path / f"{sanitize_name(name)}.pdf"
+        log_callback(f"Exporting Google Doc: {name}")
+        return export_google_workspace_file_with_retries(service, meta, 'application/pdf', out_file, log_callback, progress_percent_callback)
+    if meta.get('mimeType') == 'application/vnd.google-apps.spreadsheet':
+        out_file = current_path / f"{sanitize_name(name)}.xlsx"
+        log_callback(f"Exporting Google Sheet: {name}")
+        return export_google_workspace_file_with_retries(service, meta, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', out_file, log_callback, progress_percent_callback)
+    if meta.get('mimeType') == 'application/vnd.google-apps.presentation':
+        out_file = current_path / f"{sanitize_name(name)}.pdf"
+        log_callback(f"Exporting Google Slide: {name}")
+        return export_google_workspace_file_with_retries(service, meta, 'application/pdf', out_file, log_callback, progress_percent_callback)
+    out_file = current_path / sanitize_name(name)
+    log_callback(f"Downloading file: {name}")
+    return download_file_to_path_with_retries(service, meta, out_file, log_callback, progress_percent_callback, session=get_drive_session(creds), pending_md5=pending_md5)
 
 # --- GUI ---
 class GdriveDownloaderApp(ctk.CTk):
@@ -428,6 +882,9 @@ class GdriveDownloaderApp(ctk.CTk):
         self.log_box.grid(row=6, column=0, columnspan=3, padx=12, pady=8, sticky="nsew")
         self.log_box.configure(state="disabled")
 
+        self._log_queue = queue.Queue()
+        self.after(LOG_DRAIN_MS, self._drain_log_queue)
+
     def toggle_force_export(self):
         global FORCE_REEXPORT_NATIVE
         FORCE_REEXPORT_NATIVE = not FORCE_REEXPORT_NATIVE
@@ -440,14 +897,27 @@ class GdriveDownloaderApp(ctk.CTk):
             self.output_path_entry.insert(0, folder_selected)
 
     def append_log(self, message, color="black"):
+        # Safe from any thread: lines are queued and written by _drain_log_queue on the Tk loop
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        def _append():
+        self._log_queue.put((f"[{timestamp}] {message}", message))
+
+    def _drain_log_queue(self):
+        batch = []
+        try:
+            while len(batch) < LOG_BATCH_LINES:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
             self.log_box.configure(state="normal")
-            self.log_box.insert("end", f"[{timestamp}] {message}\n")
+            self.log_box.insert("end", "\n".join(line for line, _ in batch) + "\n")
+            excess = int(self.log_box.index("end-1c").split(".")[0]) - 1 - LOG_MAX_LINES
+            if excess > 0:
+                self.log_box.delete("1.0", f"{excess + 1}.0")
             self.log_box.see("end")
             self.log_box.configure(state="disabled")
-            self.status_label.configure(text=message)
-        self.after(0, _append)
+            self.status_label.configure(text=batch[-1][1])
+        self.after(LOG_DRAIN_MS, self._drain_log_queue)
 
     def set_progress_percent(self, pct):
         def _set():
@@ -470,7 +940,7 @@ class GdriveDownloaderApp(ctk.CTk):
                 return
             self.append_log("Authenticating...")
             creds = get_credentials()
-            service = build('drive', 'v3', credentials=creds, cache_discovery=False)
+            service = get_drive_service(creds)
 
             try:
                 folder_id = extract_file_id(url)
@@ -480,7 +950,7 @@ class GdriveDownloaderApp(ctk.CTk):
                 return
 
             self.append_log(f"Starting download for folder id: {folder_id}")
-            download_folder_recursive(service, folder_id, out_dir, lambda msg: self.append_log(msg), lambda pct: self.set_progress_percent(pct), failed_items)
+            download_folder_recursive(service, creds, folder_id, out_dir, lambda msg: self.append_log(msg), lambda pct: self.set_progress_percent(pct), failed_items)
             self.append_log("Folder download finished.")
         except FileNotFoundError as e:
             self.append_log(str(e), "red")
@@ -32,6 +32,13 @@ def get_credentials():
             f.write(creds.to_json())
     return creds
 
+# Tried in order: a bare id, then the id inside typical share/view URLs
+_ID_PATTERNS = [
+    re.compile(r'^[a-zA-Z0-9_-]{10,}$'),
+    re.compile(r'/d/([a-zA-Z0-9_-]+)'),
+    re.compile(r'id=([a-zA-Z0-9_-]+)'),
+]
+
 def extract_file_id(drive_url_or_id: str) -> str:
     # Accept raw id or typical Drive share/view URLs
     # Examples supported:
@@ -39,16 +46,10 @@ def extract_file_id(drive_url_or_id: str) -> str:
     # - https://drive.google.com/file/d/FILE_ID/view?usp=...
     # - https://drive.google.com/open?id=FILE_ID
     s = drive_url_or_id.strip()
-    # if looks like an id already (typical length and chars)
-    if re.match(r'^[a-zA-Z0-9_-]{10,}$', s):
-        return s
-    # try patterns
-    m = re.search(r'/d/([a-zA-Z0-9_-]+)', s)
-    if m:
-        return m.group(1)
-    m = re.search(r'id=([a-zA-Z0-9_-]+)', s)
-    if m:
-        return m.group(1)
+    for pattern in _ID_PATTERNS:
+        m = pattern.search(s)
+        if m:
+            return m.group(1 if pattern.groups else 0)
     raise ValueError("Could not extract file id from input")
 
 def download_file(service, file_id: str, out_dir: str):
@@ -1,5 +1,5 @@
 import os
-from pydub import AudioSegment
+import subprocess
 
 def convert_single_mp4_to_mp3(input_filepath, output_folder):
     if not os.path.exists(output_folder):
@@ -11,9 +11,18 @@ def convert_single_mp4_to_mp3(input_filepath, output_folder):
 
     print(f"Converting {filename} to MP3...")
     try:
-        audio = AudioSegment.from_file(input_filepath, format="webm")
-        audio.export(mp3_filepath, format="mp3")
+        # One ffmpeg pass; the container/codec is probed, so .webm and .mp4 both work
+        subprocess.run(
+            ['ffmpeg', '-nostdin', '-y', '-i', input_filepath, '-vn',
+             '-acodec', 'libmp3lame', '-b:a', '192k', '-threads', '0', mp3_filepath],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True
+        )
         print(f"Successfully converted {filename}")
+    except subprocess.CalledProcessError as e:
+        print(f"Error converting {filename}: {e.stderr.strip().splitlines()[-1] if e.stderr.strip() else e}")
     except Exception as e:
         print(f"Error converting {filename}: {e}")
 
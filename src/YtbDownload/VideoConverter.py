@@ -1,29 +1,61 @@
 import os
-from pydub import AudioSegment
+import glob
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 import argparse
 
+VIDEO_EXTENSIONS = (".mp4", ".webm")
+
 def convert_mp4_to_mp3(input_file, output_folder):
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
     filename = os.path.basename(input_file)
-    if filename.endswith(".mp4"):
+    if filename.lower().endswith(VIDEO_EXTENSIONS):
         mp3_filename = os.path.splitext(filename)[0] + ".mp3"
         mp3_filepath = os.path.join(output_folder, mp3_filename)
 
         print(f"Converting {filename} to MP3...")
         try:
-            audio = AudioSegment.from_file(input_file, format="mp4")
-            audio.export(mp3_filepath, format="mp3")
+            # Single ffmpeg decode+encode pass; -threads 0 lets ffmpeg use every core
+            subprocess.run(
+                ['ffmpeg', '-nostdin', '-y', '-i', input_file, '-vn',
+                 '-acodec', 'libmp3lame', '-b:a', '192k', '-threads', '0', mp3_filepath],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True
+            )
             print(f"Successfully converted {filename}")
+        except subprocess.CalledProcessError as e:
+            print(f"Error converting {filename}: {e.stderr.strip().splitlines()[-1] if e.stderr.strip() else e}")
         except Exception as e:
             print(f"Error converting {filename}: {e}")
 
+def convert_folder(input_dir, output_folder, workers=None):
+    files = []
+    for ext in VIDEO_EXTENSIONS:
+        files.extend(glob.glob(os.path.join(input_dir, f"*{ext}")))
+    if not files:
+        print(f"No video files found in {input_dir}")
+        return
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    # Half the cores: every ffmpeg job with -threads 0 is already multi-threaded
+    workers = workers or max(1, (os.cpu_count() or 2) // 2)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(convert_mp4_to_mp3, files, repeat(output_folder)))
+
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Convert a single MP4 file to MP3.")
-    parser.add_argument("input_file", help="The input MP4 file to convert.")
-    parser.add_argument("output_folder", help="The folder to save the converted MP3 file.")
+    parser = argparse.ArgumentParser(description="Convert an MP4/WebM file, or every one in a folder, to MP3.")
+    parser.add_argument("input_file", help="The input video file, or a folder of videos, to convert.")
+    parser.add_argument("output_folder", help="The folder to save the converted MP3 file(s).")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel conversions when converting a folder.")
     args = parser.parse_args()
 
-    convert_mp4_to_mp3(args.input_file, args.output_folder)
+    if os.path.isdir(args.input_file):
+        convert_folder(args.input_file, args.output_folder, args.workers)
+    else:
+        convert_mp4_to_mp3(args.input_file, args.output_folder)
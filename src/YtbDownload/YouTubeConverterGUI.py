@@ -1,63 +1,214 @@
 import os
 import re
-import glob
+import subprocess
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import yt_dlp
-from pydub import AudioSegment
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-import subprocess
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+# yt-dlp metadata cache (optional, needs diskcache). Stream URLs inside the info expire
+# after ~6h on YouTube, so entries are kept well below that.
+METADATA_CACHE_DIR = os.path.expanduser('~/.scrapt_meta')
+METADATA_CACHE_TTL = 3 * 60 * 60
+_meta_cache = Cache(METADATA_CACHE_DIR) if Cache is not None else None
+
+# Batch downloads: URLs run in parallel on the app's pool; the GUI polls their status
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_REFRESH_MS = 250
+
+# YoutubeDL instances are expensive to build and not safe to share, so each thread keeps its own
+_ydl_local = threading.local()
+
+# yt-dlp options shared by every download; download_video adds the per-call keys
+# Strategy: Use windowsfilenames=True to automatically sanitize filenames for Windows
+# Force H.264 codec for maximum compatibility (AV1 not supported by many players)
+_BASE_YDL_OPTS = {
+    'noplaylist': True,
+    'format': 'bestvideo[vcodec^=avc1][ext=mp4]+bestaudio[ext=m4a]/bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
+    'quiet': False,
+    'no_warnings': False,
+    'windowsfilenames': True,  # Sanitize filenames for Windows compatibility
+    'merge_output_format': 'mp4',  # Ensure merged output is mp4
+    'http_chunk_size': 10485760,
+    'retries': 10,
+    'fragment_retries': 10,
+    'throttledratelimit': 100_000,  # Re-open streams YouTube throttles below 100 KB/s
+    # Skip side outputs and extra requests the GUI never uses
+    'writesubtitles': False,
+    'writeautomaticsub': False,
+    'writethumbnail': False,
+    'writeinfojson': False,
+    'getcomments': False,
+    'check_formats': False,
+    'extractor_args': {'youtube': {'player_skip': ['configs', 'webpage'], 'skip': ['dash', 'translated_subs']}},
+}
+
+# ffmpeg reports the input length once, then "time=" as encoding advances
+FFMPEG_DURATION_RE = re.compile(r'Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)')
+FFMPEG_TIME_RE = re.compile(r'time=\s*(\d+):(\d+):(\d+(?:\.\d+)?)')
+
+def _hms_to_seconds(hours, minutes, seconds):
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+# Keep ffmpeg/ffprobe from flashing a console window on Windows (0 elsewhere)
+NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# Audio codecs that can be stream-copied into an .m4a container
+M4A_COPY_CODECS = {"aac", "alac"}
+
+def probe_audio_codec(path):
+    """Return the codec name of the first audio stream, or None if ffprobe fails"""
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'a:0', '-show_entries', 'stream=codec_name',
+             '-of', 'default=noprint_wrappers=1:nokey=1', path],
+            capture_output=True,
+            text=True,
+            check=False,
+            creationflags=NO_WINDOW
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+# yt-dlp calls progress hooks for every chunk; GUI updates are limited to this rate
+PROGRESS_MIN_INTERVAL = 0.2
 
 class ProgressHook:
     """yt-dlp progress hook to update GUI in real-time"""
-    def __init__(self, update_callback):
+    def __init__(self, update_callback, fraction_callback=None):
         self.update_callback = update_callback
+        self.fraction_callback = fraction_callback
+        self._last_t = 0.0
+    
+    def retarget(self, update_callback, fraction_callback=None):
+        """Point a reused hook at a new download's callbacks"""
+        self.update_callback = update_callback
+        self.fraction_callback = fraction_callback
+        self._last_t = 0.0
+    
+    @staticmethod
+    def _overall_fraction(info, frac):
+        """Scale one stream's fraction to the whole download (video + audio are fetched one after another)"""
+        formats = info.get('requested_formats')
+        if not formats or len(formats) < 2:
+            return frac
+        ids = [f.get('format_id') for f in formats]
+        if info.get('format_id') not in ids:
+            return frac
+        i = ids.index(info['format_id'])
+        sizes = [f.get('filesize') or f.get('filesize_approx') for f in formats]
+        if all(sizes):
+            return (sum(sizes[:i]) + frac * sizes[i]) / sum(sizes)
+        return (i + frac) / len(formats)
     
     def __call__(self, d):
+        if self.update_callback is None:
+            return
         if d['status'] == 'downloading':
-            percent = d.get('_percent_str', 'N/A').strip()
+            now = time.monotonic()
+            if now - self._last_t < PROGRESS_MIN_INTERVAL:
+                return
+            self._last_t = now
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if total:
+                frac = self._overall_fraction(d.get('info_dict') or {}, min(d.get('downloaded_bytes', 0) / total, 1.0))
+                percent = f"{frac:.1%}"
+                if self.fraction_callback:
+                    self.fraction_callback(frac)
+            else:
+                percent = d.get('_percent_str', 'N/A').strip()
             speed = d.get('_speed_str', 'N/A').strip()
             eta = d.get('_eta_str', 'N/A').strip()
             msg = f"Downloading: {percent} | Speed: {speed} | ETA: {eta}"
             self.update_callback(msg, "yellow")
         elif d['status'] == 'finished':
+            self._last_t = 0.0
             self.update_callback("Download finished, processing...", "yellow")
 
-def download_video(url, output_path='.', progress_callback=None):
+def _get_info(ydl, url):
+    """Return (extractor info, from_cache) for url, skipping the extractor when the cache is warm"""
+    if _meta_cache is not None:
+        info = _meta_cache.get(url)
+        if info is not None:
+            return info, True
+    # process=False: format selection still runs per download with the current options
+    info = ydl.sanitize_info(ydl.extract_info(url, download=False, process=False), remove_private_keys=True)
+    if _meta_cache is not None:
+        _meta_cache.set(url, info, expire=METADATA_CACHE_TTL)
+    return info, False
+
+def newest_mp4(directory):
+    """Return the most recently modified .mp4 in directory, or None"""
+    best = None
+    best_mtime = -1
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith('.mp4') and entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best_mtime = mtime
+                    best = entry.path
+    return best
+
+def _get_ydl(opts):
+    """Return this thread's YoutubeDL for opts, building it only when the options change"""
+    key = repr(sorted(opts.items()))
+    cached = getattr(_ydl_local, 'entry', None)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+    if cached is not None:
+        cached[1].close()
+    # yt-dlp copies progress_hooks at construction, so one hook is installed and retargeted per call
+    hook = ProgressHook(None)
+    ydl = yt_dlp.YoutubeDL({**opts, 'progress_hooks': [hook]})
+    _ydl_local.entry = (key, ydl, hook)
+    return ydl, hook
+
+def download_video(url, output_path='.', progress_callback=None, concurrent_fragments=8, fraction_callback=None):
     """Download video with real-time progress updates - optimized to avoid filename issues"""
     
-    # Strategy: Use windowsfilenames=True to automatically sanitize filenames for Windows
-    # Force H.264 codec for maximum compatibility (AV1 not supported by many players)
-    ydl_opts = {
-        'outtmpl': f'{output_path}/%(title)s.%(ext)s',
-        'noplaylist': True,
-        'format': 'bestvideo[vcodec^=avc1][ext=mp4]+bestaudio[ext=m4a]/bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-        'quiet': False,
-        'no_warnings': False,
-        'windowsfilenames': True,  # Sanitize filenames for Windows compatibility
-        'merge_output_format': 'mp4',  # Ensure merged output is mp4
-    }
-    
-    if progress_callback:
-        ydl_opts['progress_hooks'] = [ProgressHook(progress_callback)]
+    ydl_opts = _BASE_YDL_OPTS.copy()
+    ydl_opts['outtmpl'] = f'{output_path}/%(title)s.%(ext)s'
+    # Split each stream across parallel HTTP connections
+    ydl_opts['concurrent_fragment_downloads'] = concurrent_fragments
     
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info_dict = ydl.extract_info(url, download=True)
-            
-            # Get the sanitized title that was actually used
-            title = ydl.prepare_filename(info_dict)
-            
-            # Check if file exists
-            if os.path.exists(title):
-                return title
-            
-            # Fallback: find the most recently created mp4 file
-            mp4_files = glob.glob(os.path.join(output_path, "*.mp4"))
-            if mp4_files:
-                return max(mp4_files, key=os.path.getmtime)
+        ydl, hook = _get_ydl(ydl_opts)
+        hook.retarget(progress_callback, fraction_callback)
+        try:
+            info, from_cache = _get_info(ydl, url)
+            try:
+                info_dict = ydl.process_ie_result(info, download=True)
+            except yt_dlp.utils.DownloadError:
+                if not from_cache:
+                    raise
+                # Cached stream URLs may have expired: extract again once
+                _meta_cache.delete(url)
+                info, _ = _get_info(ydl, url)
+                info_dict = ydl.process_ie_result(info, download=True)
             
-            return None
+            # yt-dlp records the final (merged) path; otherwise rebuild it from the template
+            downloads = info_dict.get('requested_downloads') or [{}]
+            filepath = downloads[0].get('filepath')
+            if not filepath:
+                filepath = os.path.splitext(ydl.prepare_filename(info_dict))[0] + '.' + (info_dict.get('ext') or 'mp4')
+            try:
+                os.stat(filepath)
+                return filepath
+            except FileNotFoundError:
+                # Fallback: find the most recently modified mp4 file
+                return newest_mp4(output_path)
+        finally:
+            hook.retarget(None)
     except Exception as e:
         raise Exception(f"Download failed: {str(e)}")
 
@@ -66,17 +217,17 @@ class YouTubeConverterApp(ctk.CTk):
         super().__init__()
 
         self.title("YouTube Downloader & Converter")
-        self.geometry("800x500")
+        self.geometry("800x760")
 
         # Configure grid layout
         self.grid_columnconfigure(1, weight=1)
-        self.grid_rowconfigure((0, 1, 2, 3, 4, 5), weight=1)
+        self.grid_rowconfigure((0, 1, 2, 3, 4, 5, 6, 7, 8), weight=1)
 
-        # URL Input
-        self.url_label = ctk.CTkLabel(self, text="YouTube URL:")
-        self.url_label.grid(row=0, column=0, padx=10, pady=10, sticky="w")
-        self.url_entry = ctk.CTkEntry(self, placeholder_text="Enter YouTube video URL")
-        self.url_entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
+        # URL Input (one URL per line)
+        self.url_label = ctk.CTkLabel(self, text="YouTube URL(s):")
+        self.url_label.grid(row=0, column=0, padx=10, pady=10, sticky="nw")
+        self.url_box = ctk.CTkTextbox(self, height=80)
+        self.url_box.grid(row=0, column=1, columnspan=2, padx=10, pady=10, sticky="ew")
 
         # Output Path Input
         self.output_path_label = ctk.CTkLabel(self, text="Output Directory:")
@@ -86,44 +237,94 @@ class YouTubeConverterApp(ctk.CTk):
         self.browse_button = ctk.CTkButton(self, text="Browse", command=self.browse_output_path)
         self.browse_button.grid(row=1, column=2, padx=10, pady=10, sticky="e")
 
+        # Parallel connections per download
+        self.concurrency_label = ctk.CTkLabel(self, text="Connections:")
+        self.concurrency_label.grid(row=2, column=0, padx=10, pady=10, sticky="w")
+        self.concurrency_var = ctk.StringVar(value="8")
+        self.concurrency_menu = ctk.CTkOptionMenu(self, values=["1", "2", "4", "8", "16"], variable=self.concurrency_var, width=80)
+        self.concurrency_menu.grid(row=2, column=1, padx=10, pady=10, sticky="w")
+        self.clear_cache_button = ctk.CTkButton(self, text="Clear metadata cache", command=self.clear_metadata_cache)
+        self.clear_cache_button.grid(row=2, column=2, padx=10, pady=10, sticky="e")
+        if _meta_cache is None:
+            self.clear_cache_button.configure(state="disabled")
+
         # Download Button
-        self.download_button = ctk.CTkButton(self, text="Download Video", command=self.start_download)
-        self.download_button.grid(row=2, column=0, columnspan=3, padx=10, pady=10, sticky="ew")
+        self.download_button = ctk.CTkButton(self, text="Download Video(s)", command=self.start_download)
+        self.download_button.grid(row=3, column=0, columnspan=3, padx=10, pady=10, sticky="ew")
+
+        # Audio format: MP3 re-encodes, M4A copies the AAC track as-is
+        self.audio_format_label = ctk.CTkLabel(self, text="Audio Format:")
+        self.audio_format_label.grid(row=4, column=0, padx=10, pady=10, sticky="w")
+        self.audio_format_var = ctk.StringVar(value="mp3")
+        self.audio_format_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.audio_format_frame.grid(row=4, column=1, columnspan=2, padx=10, pady=10, sticky="w")
+        self.mp3_radio = ctk.CTkRadioButton(self.audio_format_frame, text="MP3 (re-encode)", variable=self.audio_format_var, value="mp3")
+        self.mp3_radio.grid(row=0, column=0, padx=(0, 20), sticky="w")
+        self.m4a_radio = ctk.CTkRadioButton(self.audio_format_frame, text="M4A (stream-copy)", variable=self.audio_format_var, value="m4a")
+        self.m4a_radio.grid(row=0, column=1, sticky="w")
 
         # Convert Button
-        self.convert_button = ctk.CTkButton(self, text="Convert Last Downloaded to MP3", command=self.start_conversion)
-        self.convert_button.grid(row=3, column=0, columnspan=3, padx=10, pady=10, sticky="ew")
+        self.convert_button = ctk.CTkButton(self, text="Convert Last Downloaded to Audio", command=self.start_conversion)
+        self.convert_button.grid(row=5, column=0, columnspan=3, padx=10, pady=10, sticky="ew")
 
         # Progress Bar
         self.progress_label = ctk.CTkLabel(self, text="Progress:", text_color="gray")
-        self.progress_label.grid(row=4, column=0, padx=10, pady=5, sticky="w")
+        self.progress_label.grid(row=6, column=0, padx=10, pady=5, sticky="w")
         self.progress_bar = ctk.CTkProgressBar(self, mode='determinate')
         self.progress_bar.set(0)
-        self.progress_bar.grid(row=4, column=1, columnspan=2, padx=10, pady=5, sticky="ew")
+        self.progress_bar.grid(row=6, column=1, columnspan=2, padx=10, pady=5, sticky="ew")
 
         # Status Label
         self.status_label = ctk.CTkLabel(self, text="Ready", wraplength=700, justify="left")
-        self.status_label.grid(row=5, column=0, columnspan=3, padx=10, pady=10, sticky="ew")
+        self.status_label.grid(row=7, column=0, columnspan=3, padx=10, pady=10, sticky="ew")
+
+        # Per-URL download rows
+        self.downloads_frame = ctk.CTkScrollableFrame(self, height=140)
+        self.downloads_frame.grid(row=8, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
+        self.downloads_frame.grid_columnconfigure(0, weight=1)
+
+        # Shared with download workers; guarded by _state_lock
+        self._state_lock = threading.Lock()
+        self._download_status = {}
+        self._download_fraction = {}
+        self._pending_downloads = 0
+        self._download_rows = {}
 
         self.last_downloaded_file = None
         self.is_downloading = False
         self.is_converting = False
 
+        # Pool workers are not daemon threads: closing the window cancels queued URLs
+        # and aborts running ones so the process exits with the window
+        self._download_executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+        self._closing = threading.Event()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        self._closing.set()
+        self._download_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
     def browse_output_path(self):
         folder_selected = filedialog.askdirectory()
         if folder_selected:
             self.output_path_entry.delete(0, ctk.END)
             self.output_path_entry.insert(0, folder_selected)
 
+    def clear_metadata_cache(self):
+        if _meta_cache is not None:
+            _meta_cache.clear()
+            self.update_status("🧹 Metadata cache cleared.", "green")
+
     def update_status(self, message, color="white"):
         self.status_label.configure(text=message, text_color=color)
         self.update()  # Force GUI refresh
 
     def start_download(self):
-        url = self.url_entry.get()
+        urls = list(dict.fromkeys(line.strip() for line in self.url_box.get("1.0", "end").splitlines() if line.strip()))
         output_dir = self.output_path_entry.get()
 
-        if not url:
+        if not urls:
             self.update_status("❌ Please enter a YouTube URL.", "red")
             return
         if not output_dir:
@@ -138,41 +339,92 @@ class YouTubeConverterApp(ctk.CTk):
         self.download_button.configure(state="disabled")
         self.convert_button.configure(state="disabled")
         self.progress_bar.set(0)
+        self.update_status(f"📥 Downloading {len(urls)} video(s)... This may take a while.", "yellow")
 
-        # Run download in a separate thread
-        thread = threading.Thread(target=self._download_worker, args=(url, output_dir), daemon=True)
-        thread.start()
+        for row in self._download_rows.values():
+            row.destroy()
+        self._download_rows = {}
+        with self._state_lock:
+            self._download_status = {url: ("⏳ Queued", "gray") for url in urls}
+            self._download_fraction = {url: 0.0 for url in urls}
+            self._pending_downloads = len(urls)
+
+        concurrent_fragments = int(self.concurrency_var.get())
+        for i, url in enumerate(urls):
+            row = ctk.CTkLabel(self.downloads_frame, text=url, anchor="w", justify="left", wraplength=700)
+            row.grid(row=i, column=0, padx=5, pady=2, sticky="ew")
+            self._download_rows[url] = row
+            self._download_executor.submit(self._download_worker, url, output_dir, concurrent_fragments)
+
+        self.after(DOWNLOAD_REFRESH_MS, self._refresh_downloads)
+
+    def _download_worker(self, url, output_dir, concurrent_fragments):
+        """Pool worker for one URL; reports into _download_status, never touches widgets"""
+        def report(message, color="yellow"):
+            with self._state_lock:
+                self._download_status[url] = (message, color)
+
+        def report_progress(message, color="yellow"):
+            # Raising from a progress hook makes yt-dlp abandon the download
+            if self._closing.is_set():
+                raise yt_dlp.utils.DownloadCancelled("Window closed")
+            report(message, color)
+
+        def report_fraction(frac):
+            with self._state_lock:
+                self._download_fraction[url] = frac
 
-    def _download_worker(self, url, output_dir):
-        """Worker thread for downloading"""
         try:
-            self.update_status("📥 Downloading video... This may take a while.", "yellow")
-            downloaded_filepath = download_video(url, output_dir, progress_callback=self.update_status)
-            
+            report("📥 Downloading video...")
+            downloaded_filepath = download_video(url, output_dir, progress_callback=report_progress, concurrent_fragments=concurrent_fragments, fraction_callback=report_fraction)
+
             if downloaded_filepath and os.path.exists(downloaded_filepath):
-                self.last_downloaded_file = downloaded_filepath
+                with self._state_lock:
+                    self.last_downloaded_file = downloaded_filepath
                 file_size = os.path.getsize(downloaded_filepath) / (1024 * 1024)  # MB
-                self.progress_bar.set(1.0)
-                self.update_status(f"✅ Download complete: {os.path.basename(downloaded_filepath)} ({file_size:.1f} MB)", "green")
+                report(f"✅ Download complete: {os.path.basename(downloaded_filepath)} ({file_size:.1f} MB)", "green")
             else:
-                self.update_status("❌ Download failed or file path could not be determined.", "red")
-                self.progress_bar.set(0)
+                report("❌ Download failed or file path could not be determined.", "red")
         except Exception as e:
-            self.update_status(f"❌ Download error: {str(e)}", "red")
-            self.progress_bar.set(0)
+            report(f"❌ Download error: {str(e)}", "red")
         finally:
-            self.is_downloading = False
-            self.download_button.configure(state="normal")
-            self.convert_button.configure(state="normal")
+            with self._state_lock:
+                self._download_fraction[url] = 1.0
+                self._pending_downloads -= 1
+
+    def _refresh_downloads(self):
+        """Redraw the per-URL rows on the Tk thread until every download has finished"""
+        with self._state_lock:
+            statuses = dict(self._download_status)
+            done = sum(self._download_fraction.values())
+            pending = self._pending_downloads
+        for url, (message, color) in statuses.items():
+            self._download_rows[url].configure(text=f"{url}\n    {message}", text_color=color)
+        self.progress_bar.set(done / len(statuses) if statuses else 0)
+
+        if pending:
+            self.after(DOWNLOAD_REFRESH_MS, self._refresh_downloads)
+            return
+
+        failed = sum(1 for _, color in statuses.values() if color == "red")
+        if failed:
+            self.update_status(f"⚠️ Finished with {failed} of {len(statuses)} download(s) failed.", "orange")
+        else:
+            self.update_status(f"✅ All {len(statuses)} download(s) complete.", "green")
+        self.is_downloading = False
+        self.download_button.configure(state="normal")
+        self.convert_button.configure(state="normal")
 
     def start_conversion(self):
-        if not self.last_downloaded_file:
+        with self._state_lock:
+            last_downloaded_file = self.last_downloaded_file
+        if not last_downloaded_file:
             self.update_status("❌ No video downloaded yet to convert.", "red")
             return
 
         output_dir = self.output_path_entry.get()
         if not output_dir:
-            self.update_status("❌ Please select an output directory for MP3.", "red")
+            self.update_status("❌ Please select an output directory for the audio file.", "red")
             return
 
         if self.is_downloading or self.is_converting:
@@ -185,45 +437,68 @@ class YouTubeConverterApp(ctk.CTk):
         self.progress_bar.set(0)
 
         # Run conversion in a separate thread
-        thread = threading.Thread(target=self._conversion_worker, args=(output_dir,), daemon=True)
+        thread = threading.Thread(target=self._conversion_worker, args=(last_downloaded_file, output_dir, self.audio_format_var.get()), daemon=True)
         thread.start()
 
-    def _conversion_worker(self, output_dir):
-        """Worker thread for converting to MP3"""
+    def _conversion_worker(self, input_file, output_dir, audio_format="mp3"):
+        """Worker thread for extracting the audio track (MP3 or M4A); widget updates go through after()"""
         try:
-            self.update_status("🎵 Converting to MP3... This may take a few moments.", "yellow")
-            
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-            python_executable = os.path.join(project_root, ".venv", "Scripts", "python.exe")
-            video_converter_script = os.path.join(project_root, "src", "YtbDownload", "VideoConverter.py")
-            
-            if not os.path.exists(python_executable):
-                python_executable = "python"
+            self.after(0, self.update_status, f"🎵 Converting to {audio_format.upper()}... This may take a few moments.", "yellow")
 
-            result = subprocess.run(
-                [python_executable, video_converter_script, self.last_downloaded_file, output_dir],
-                capture_output=True,
+            os.makedirs(output_dir, exist_ok=True)
+            audio_name = os.path.splitext(os.path.basename(input_file))[0] + '.' + audio_format
+            audio_path = os.path.join(output_dir, audio_name)
+
+            # Copy the track untouched whenever the container allows it; only re-encode otherwise
+            source_codec = probe_audio_codec(input_file)
+            if audio_format == "m4a":
+                codec_args = ['-c:a', 'copy'] if source_codec in M4A_COPY_CODECS else ['-c:a', 'aac', '-b:a', '192k']
+            elif source_codec == "mp3":
+                codec_args = ['-c:a', 'copy']
+            else:
+                codec_args = ['-c:a', 'libmp3lame', '-q:a', '2', '-threads', '0']
+
+            # Same ffmpeg binary yt-dlp needs for merging; progress is read from its stderr
+            proc = subprocess.Popen(
+                ['ffmpeg', '-nostdin', '-y', '-i', input_file, '-vn', *codec_args, audio_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=False
+                errors='replace',
+                bufsize=1,
+                creationflags=NO_WINDOW
             )
-            
-            if result.returncode == 0:
-                mp3_name = os.path.basename(self.last_downloaded_file).replace('.mp4', '.mp3')
-                mp3_path = os.path.join(output_dir, mp3_name)
-                mp3_size = os.path.getsize(mp3_path) / (1024 * 1024) if os.path.exists(mp3_path) else 0
-                self.progress_bar.set(1.0)
-                self.update_status(f"✅ Conversion complete: {mp3_name} ({mp3_size:.1f} MB)", "green")
+            duration = None
+            stderr_tail = deque(maxlen=20)
+            for line in proc.stderr:
+                stderr_tail.append(line.strip())
+                if duration is None:
+                    match = FFMPEG_DURATION_RE.search(line)
+                    if match:
+                        duration = _hms_to_seconds(*match.groups())
+                match = FFMPEG_TIME_RE.search(line)
+                if match and duration:
+                    self.after(0, self.progress_bar.set, min(1.0, _hms_to_seconds(*match.groups()) / duration))
+            proc.wait()
+
+            if proc.returncode == 0:
+                audio_size = os.path.getsize(audio_path) / (1024 * 1024) if os.path.exists(audio_path) else 0
+                self.after(0, self.progress_bar.set, 1.0)
+                self.after(0, self.update_status, f"✅ Conversion complete: {audio_name} ({audio_size:.1f} MB)", "green")
             else:
-                error_msg = result.stderr if result.stderr else "Unknown error"
-                self.update_status(f"❌ Conversion error: {error_msg}", "red")
-                self.progress_bar.set(0)
+                error_msg = next((line for line in reversed(stderr_tail) if line), "Unknown error")
+                self.after(0, self.update_status, f"❌ Conversion error: {error_msg}", "red")
+                self.after(0, self.progress_bar.set, 0)
         except Exception as e:
-            self.update_status(f"❌ Conversion failed: {str(e)}", "red")
-            self.progress_bar.set(0)
+            self.after(0, self.update_status, f"❌ Conversion failed: {str(e)}", "red")
+            self.after(0, self.progress_bar.set, 0)
         finally:
-            self.is_converting = False
-            self.download_button.configure(state="normal")
-            self.convert_button.configure(state="normal")
+            self.after(0, self._finish_conversion)
+
+    def _finish_conversion(self):
+        self.is_converting = False
+        self.download_button.configure(state="normal")
+        self.convert_button.configure(state="normal")
 
 if __name__ == "__main__":
     ctk.set_appearance_mode("System")  # Modes: "System" (standard), "Dark", "Light"
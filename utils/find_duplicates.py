@@ -1,15 +1,62 @@
 #!/usr/bin/env python3
 """
 Find duplicate files in a directory by comparing names and extensions.
+Same-name files are confirmed as duplicates by size and content hash.
 Also provides information about the duplicates found.
 """
 
 import os
+import sys
+import time
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 import argparse
 from datetime import datetime
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+HASH_CHUNK = 1 << 20  # 1 MiB reads while hashing
+
+def _walk(path):
+    """Yield a DirEntry for every regular file below path, without following symlinks."""
+    try:
+        it = os.scandir(path)
+    except OSError:
+        # Unreadable or vanished directory: skip it, as os.walk does
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+def _content_hash(path):
+    """Hex digest of a file's contents: BLAKE3 when installed, SHA-256 otherwise."""
+    with open(path, 'rb', buffering=0) as f:
+        if blake3 is None and hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        # Python < 3.11 has no file_digest: fall back to a chunked read loop
+        h = blake3() if blake3 is not None else hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            h.update(chunk)
+        return h.hexdigest()
+
+def _format_mtime(mtime):
+    """Format a raw st_mtime for reports; the scan loop itself never formats."""
+    return time.strftime(TIME_FORMAT, time.localtime(mtime))
 
 class DuplicateFinder:
     def __init__(self, target_dir):
@@ -26,26 +73,75 @@ class DuplicateFinder:
         print(f"Scanning directory: {self.target_dir}")
         
         # Reset counters
-        self.duplicates.clear()
         self.total_files = 0
         self.duplicate_sets = 0
         
-        # Walk through the directory
-        for root, _, files in os.walk(self.target_dir):
-            for filename in files:
-                self.total_files += 1
-                file_path = Path(root) / filename
-                
-                # Use the filename as the key for duplicate detection
-                self.duplicates[filename].append({
-                    'path': str(file_path),
-                    'size': file_path.stat().st_size,
-                    'modified': datetime.fromtimestamp(file_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                })
-        
-        # Remove entries that don't have duplicates
+        # First pass: count names only, so unique files never get a record
+        names = Counter()
+        for entry in _walk(self.target_dir):
+            names[entry.name] += 1
+            self.total_files += 1
+        
+        # Second pass: stat only the files whose name appears more than once
+        self.duplicates = {name: [] for name, count in names.items() if count > 1}
+        del names
+        for entry in _walk(self.target_dir):
+            copies = self.duplicates.get(entry.name)
+            if copies is None:
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            copies.append({
+                'path': entry.path,
+                'size': st.st_size,
+                'mtime': st.st_mtime
+            })
+        
+        # Files can vanish between the passes
         self.duplicates = {k: v for k, v in self.duplicates.items() if len(v) > 1}
+        self._confirm_by_content()
         self.duplicate_sets = len(self.duplicates)
+    
+    def _confirm_by_content(self):
+        """Keep only same-name files whose size and content hash also match."""
+        candidates = []
+        for filename, copies in self.duplicates.items():
+            by_size = defaultdict(list)
+            for copy in copies:
+                by_size[copy['size']].append(copy)
+            candidates.extend((filename, group) for group in by_size.values() if len(group) > 1)
+        
+        # Only files that share both a name and a size are read from disk
+        to_hash = [copy for _, group in candidates for copy in group]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for copy, digest in zip(to_hash, executor.map(self._safe_hash, to_hash)):
+                copy['hash'] = digest
+        
+        groups = defaultdict(list)
+        for filename, group in candidates:
+            for copy in group:
+                if copy['hash'] is not None:
+                    groups[(filename, copy['hash'])].append(copy)
+        groups = {k: v for k, v in groups.items() if len(v) > 1}
+        
+        # A name only gets a hash suffix when it has more than one distinct content
+        per_name = defaultdict(int)
+        for filename, _ in groups:
+            per_name[filename] += 1
+        self.duplicates = {
+            (filename if per_name[filename] == 1 else f"{filename} [{digest[:12]}]"): copies
+            for (filename, digest), copies in groups.items()
+        }
+    
+    @staticmethod
+    def _safe_hash(copy):
+        try:
+            return _content_hash(copy['path'])
+        except OSError as e:
+            print(f"Error hashing {copy['path']}: {e}")
+            return None
         
     def print_report(self):
         """Print a detailed report of the duplicates found."""
@@ -60,27 +156,40 @@ class DuplicateFinder:
         print("\nDuplicate files found:")
         print("=" * 80)
         
+        # Build the body in memory and write it once rather than print per line
+        out = []
+        append = out.append
         for filename, copies in self.duplicates.items():
-            print(f"\nFilename: {filename}")
-            print("-" * 40)
+            append(f"\nFilename: {filename}\n" + "-" * 40 + "\n")
             for copy in copies:
-                print(f"  Location: {copy['path']}")
-                print(f"  Size: {copy['size']} bytes")
-                print(f"  Modified: {copy['modified']}")
-                print()
+                append(f"  Location: {copy['path']}\n"
+                       f"  Size: {copy['size']} bytes\n"
+                       f"  Modified: {_format_mtime(copy['mtime'])}\n"
+                       f"  Hash: {copy['hash']}\n\n")
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
     
     def save_report(self, output_file):
         """Save the duplicate report to a JSON file."""
         report = {
-            'scan_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'scan_time': datetime.now().strftime(TIME_FORMAT),
             'target_directory': str(self.target_dir),
             'total_files': self.total_files,
             'duplicate_sets': self.duplicate_sets,
-            'duplicates': self.duplicates
+            'duplicates': {
+                name: [{'path': c['path'], 'size': c['size'], 'modified': _format_mtime(c['mtime']), 'hash': c['hash']}
+                       for c in copies]
+                for name, copies in self.duplicates.items()
+            }
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # orjson emits UTF-8 bytes directly; stdlib json is the fallback
+        if orjson is not None:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(output_file, 'wb') as f:
+            f.write(data)
         print(f"\nReport saved to: {output_file}")
     
     def remove_duplicates(self, keep_newest=True):
@@ -94,9 +203,8 @@ class DuplicateFinder:
         
         print("\nRemoving duplicates...")
         for filename, copies in self.duplicates.items():
-            # Sort copies by modification time
-            sorted_copies = sorted(copies, key=lambda x: os.path.getmtime(x['path']), 
-                                reverse=keep_newest)
+            # Sort copies by the modification time recorded during the scan
+            sorted_copies = sorted(copies, key=lambda x: x['mtime'], reverse=keep_newest)
             
             # Keep the first one (either newest or oldest)
             keeper = sorted_copies[0]
@@ -108,8 +216,9 @@ class DuplicateFinder:
             
             for copy in to_remove:
                 try:
-                    file_size = os.path.getsize(copy['path'])
+                    file_size = copy['size']
                     os.remove(copy['path'])
+                    copies.remove(copy)
                     print(f"- {copy['path']}")
                     removed_count += 1
                     saved_space += file_size
@@ -120,11 +229,13 @@ class DuplicateFinder:
         print(f"Files removed: {removed_count}")
         print(f"Space saved: {saved_space / (1024*1024):.2f} MB")
         
-        # Rescan to update the duplicates list
-        self.scan_for_duplicates()
+        # Drop the removed copies from the in-memory state instead of rescanning
+        self.duplicates = {k: v for k, v in self.duplicates.items() if len(v) > 1}
+        self.total_files -= removed_count
+        self.duplicate_sets = len(self.duplicates)
 
 def main():
-    parser = argparse.ArgumentParser(description='Find duplicate files by name in a directory.')
+    parser = argparse.ArgumentParser(description='Find duplicate files by name and content in a directory.')
     parser.add_argument('directory', help='Directory to scan for duplicates')
     parser.add_argument('--output', '-o', help='Save report to JSON file')
     parser.add_argument('--remove', '-r', action='store_true', help='Remove duplicate files')